@@ -0,0 +1,34 @@
+"""add_bids_listing_index
+
+Revision ID: a41c7f09d2e8
+Revises: 56820dcb6bd7
+Create Date: 2026-09-01 09:14:51.402318+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c7f09d2e8'
+down_revision: Union[str, None] = '56820dcb6bd7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index matching the bid listing query: equality filters on
+    # is_active/status with ORDER BY created_at DESC, so pages come
+    # straight off a bounded index walk instead of filter + sort.
+    op.create_index(
+        'idx_bids_active_status_created',
+        'bids',
+        ['is_active', 'status', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_bids_active_status_created', table_name='bids')
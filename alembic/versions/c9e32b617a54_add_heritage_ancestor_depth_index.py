@@ -0,0 +1,35 @@
+"""add_heritage_ancestor_depth_index
+
+Revision ID: c9e32b617a54
+Revises: a41c7f09d2e8
+Create Date: 2026-09-01 10:02:37.881264+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e32b617a54'
+down_revision: Union[str, None] = 'a41c7f09d2e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers the ancestor-side closure-table queries (children via
+    # depth_distance = 1, descendant walks) as an index-only scan;
+    # the descendant-side and ancestor+descendant composites already
+    # exist from the initial revision.
+    op.create_index(
+        'idx_ancestor_depth',
+        'heritage_lineage',
+        ['ancestor_node_id', 'depth_distance'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_ancestor_depth', table_name='heritage_lineage')
@@ -0,0 +1,50 @@
+"""add_cost_code_lookup_indexes
+
+Revision ID: e7d04a8f913b
+Revises: c9e32b617a54
+Create Date: 2026-09-01 10:21:08.547293+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7d04a8f913b'
+down_revision: Union[str, None] = 'c9e32b617a54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression index serving the code == code.upper() exact-match
+    # lookup without a table scan.
+    op.create_index(
+        'idx_cost_code_upper',
+        'cost_codes',
+        [sa.text('upper(code)')],
+        unique=False,
+    )
+
+    # Trigram index so ilike '%term%' search becomes an indexed scan;
+    # pg_trgm is PostgreSQL-only, so other dialects get a plain index.
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'idx_cost_code_name_trgm',
+            'cost_codes',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        )
+    else:
+        op.create_index('idx_cost_code_name_trgm', 'cost_codes', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_cost_code_name_trgm', table_name='cost_codes')
+    op.drop_index('idx_cost_code_upper', table_name='cost_codes')
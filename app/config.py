@@ -44,6 +44,10 @@ class Settings(BaseSettings):
     DEFAULT_COST_CODE_COUNT: int = 83
     ENABLE_BID_CALCULATION: bool = True
     ENABLE_ROI_ANALYSIS: bool = True
+    # In-process bid calculation result cache; disable when running
+    # multiple workers, since invalidation on cost-code changes does
+    # not cross process boundaries.
+    ENABLE_BID_CALC_CACHE: bool = True
 
     # Contextual Chain Configuration
     ENABLE_CONTEXTUAL_TRACKING: bool = True
@@ -17,8 +17,12 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class. expire_on_commit=False keeps instances
+# usable after commit without a re-hydrating SELECT; server-generated
+# columns still load lazily on first access.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Create Base class for models
 Base = declarative_base()
@@ -0,0 +1,89 @@
+"""Graph algorithms for contextual chain auditing."""
+
+from typing import Dict, List, Set
+
+
+def strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Find strongly connected components using iterative Tarjan.
+
+    Runs in O(V + E) with an explicit work stack, so one pass over the
+    whole graph replaces a DFS per edge and deep graphs do not touch the
+    interpreter's recursion limit.
+
+    Args:
+        graph: Adjacency map of node ID to neighbor node IDs; neighbors
+            absent from the map are treated as isolated nodes
+
+    Returns:
+        List of components, each a list of node IDs
+    """
+    index_counter = 0
+    indices: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in graph:
+        if root in indices:
+            continue
+
+        indices[root] = lowlink[root] = index_counter
+        index_counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            descended = False
+            for neighbor in neighbors:
+                if neighbor not in indices:
+                    indices[neighbor] = lowlink[neighbor] = index_counter
+                    index_counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    descended = True
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], indices[neighbor])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == indices[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def find_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Return every cycle group in the graph.
+
+    A cycle group is a strongly connected component with more than one
+    node, or a single node with a self-loop.
+
+    Args:
+        graph: Adjacency map of node ID to neighbor node IDs
+
+    Returns:
+        List of cycle groups, each a list of node IDs
+    """
+    return [
+        component
+        for component in strongly_connected_components(graph)
+        if len(component) > 1 or component[0] in graph.get(component[0], ())
+    ]
@@ -3,6 +3,7 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import init_db
@@ -18,52 +19,69 @@ async def lifespan(app: FastAPI):
     # Shutdown (cleanup if needed)
 
 
-# Create FastAPI app
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    description="SaaS API for managing 83+ construction cost codes with automated bid calculation and ROI analysis",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-    lifespan=lifespan,
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=settings.CORS_CREDENTIALS,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers with API prefix
-app.include_router(cost_codes_router, prefix=settings.API_PREFIX)
-app.include_router(bids_router, prefix=settings.API_PREFIX)
-app.include_router(analysis_router, prefix=settings.API_PREFIX)
-app.include_router(contextual_chains_router, prefix=settings.API_PREFIX)
-
-
-@app.get("/", tags=["Root"])
-async def root():
-    """Root endpoint."""
-    return {
-        "message": "Welcome to EV-MAX Catalog API",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "redoc": "/redoc",
-    }
-
-
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT,
-        "version": settings.APP_VERSION,
-    }
+def create_app() -> FastAPI:
+    """
+    Build and configure a FastAPI application instance.
+
+    Keeping construction in a factory lets tests (and any future
+    multi-config deployments) build the app explicitly instead of
+    relying on import side effects.
+
+    Returns:
+        Configured FastAPI application
+    """
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        description="SaaS API for managing 83+ construction cost codes with automated bid calculation and ROI analysis",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        # orjson serializes the nested dicts in list responses several times
+        # faster than the stdlib encoder and writes bytes directly.
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=settings.CORS_CREDENTIALS,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers with API prefix
+    app.include_router(cost_codes_router, prefix=settings.API_PREFIX)
+    app.include_router(bids_router, prefix=settings.API_PREFIX)
+    app.include_router(analysis_router, prefix=settings.API_PREFIX)
+    app.include_router(contextual_chains_router, prefix=settings.API_PREFIX)
+
+    @app.get("/", tags=["Root"])
+    async def root():
+        """Root endpoint."""
+        return {
+            "message": "Welcome to EV-MAX Catalog API",
+            "version": settings.APP_VERSION,
+            "docs": "/docs",
+            "redoc": "/redoc",
+        }
+
+    @app.get("/health", tags=["Health"])
+    async def health_check():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "environment": settings.ENVIRONMENT,
+            "version": settings.APP_VERSION,
+        }
+
+    return app
+
+
+# Module-level instance for uvicorn and existing imports
+app = create_app()
 
 
 if __name__ == "__main__":
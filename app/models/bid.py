@@ -1,7 +1,7 @@
 """Bid database model."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, JSON, Index
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -45,32 +45,45 @@ class Bid(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
+    __table_args__ = (
+        # Matches the listing query (filter on is_active/status, order by
+        # created_at DESC) so the page is served straight off the index
+        # without a sort step.
+        Index('idx_bids_active_status_created', 'is_active', 'status', created_at.desc()),
+    )
+
     def __repr__(self) -> str:
         """String representation of Bid."""
         return f"<Bid(bid_number='{self.bid_number}', project='{self.project_name}', total={self.total_amount})>"
 
     def calculate_totals(self) -> None:
         """Calculate bid totals from line items."""
-        self.subtotal = sum(item.get("total", 0) for item in self.line_items or [])
-        self.tax_amount = self.subtotal * (self.tax_rate / 100)
-        self.total_amount = self.subtotal + self.tax_amount
+        # Compute in locals first: ORM attribute access goes through the
+        # instrumented descriptor, so reading self.subtotal back twice
+        # costs more than a plain local.
+        subtotal = sum(item.get("total", 0) for item in self.line_items or [])
+        tax_amount = subtotal * (self.tax_rate / 100)
+        self.subtotal = subtotal
+        self.tax_amount = tax_amount
+        self.total_amount = subtotal + tax_amount
 
     def calculate_roi(self) -> dict:
         """
         Calculate ROI metrics.
-        
+
         Returns:
             Dictionary with ROI calculations
         """
-        if not self.estimated_revenue or not self.estimated_cost:
+        revenue = self.estimated_revenue
+        cost = self.estimated_cost
+        if not revenue or not cost:
             return {}
-        
-        roi = ((self.estimated_revenue - self.estimated_cost) / self.estimated_cost) * 100
-        profit = self.estimated_revenue - self.estimated_cost
-        
+
+        profit = revenue - cost
+
         return {
-            "roi_percentage": round(roi, 2),
+            "roi_percentage": round(profit / cost * 100, 2),
             "profit": round(profit, 2),
-            "estimated_revenue": self.estimated_revenue,
-            "estimated_cost": self.estimated_cost,
+            "estimated_revenue": revenue,
+            "estimated_cost": cost,
         }
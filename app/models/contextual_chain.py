@@ -38,4 +38,5 @@ class HeritageLineage(Base):
     __table_args__ = (
         Index('idx_ancestor_descendant', 'ancestor_node_id', 'descendant_node_id', unique=True),
         Index('idx_descendant_depth', 'descendant_node_id', 'depth_distance'),
+        Index('idx_ancestor_depth', 'ancestor_node_id', 'depth_distance'),
     )
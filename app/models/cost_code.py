@@ -1,7 +1,7 @@
 """Cost code database model."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -33,6 +33,21 @@ class CostCode(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
+    __table_args__ = (
+        # Expression index serving the code == code.upper() lookup in
+        # get_cost_code_by_code without a table scan.
+        Index('idx_cost_code_upper', func.upper(code)),
+        # Trigram index so ilike '%term%' search uses an indexed scan on
+        # PostgreSQL; other dialects ignore the GIN options and treat it
+        # as a plain index on name.
+        Index(
+            'idx_cost_code_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of CostCode."""
         return f"<CostCode(code='{self.code}', name='{self.name}', unit_price={self.unit_price})>"
@@ -47,6 +62,4 @@ class CostCode(Base):
         Returns:
             Total cost including markup
         """
-        base_cost = self.unit_price * quantity
-        markup_amount = base_cost * (self.markup_percentage / 100)
-        return base_cost + markup_amount
+        return self.unit_price * quantity * (1.0 + self.markup_percentage / 100)
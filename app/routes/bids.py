@@ -1,7 +1,11 @@
 """Bid API routes."""
 
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -10,6 +14,7 @@ from app.schemas.bid import (
     BidUpdate,
     BidResponse,
     BidList,
+    BidCalculateLineItem,
     BidCalculateRequest,
     BidCalculateResponse,
     ROIAnalysisRequest,
@@ -18,6 +23,10 @@ from app.schemas.bid import (
 from app.services.bid_service import BidService
 from app.config import settings
 
+# Built once at import; converts validated calculation items back to the
+# plain dicts the service layer works with in a single pass.
+_CALC_ITEMS_ADAPTER = TypeAdapter(list[BidCalculateLineItem])
+
 router = APIRouter(prefix="/bids", tags=["Bids"])
 
 
@@ -62,6 +71,54 @@ def list_bids(
     )
 
 
+@router.get(
+    "/stream",
+    responses={200: {"model": BidList, "description": "Paginated bid list, streamed"}},
+)
+def stream_bids(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="Items per page",
+    ),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream a page of bids as incrementally-serialized JSON.
+
+    Same payload shape as the list endpoint, but rows are fetched in
+    batches (yield_per) and each bid is serialized and flushed
+    individually, so at no point does the whole page sit in memory —
+    useful for large page sizes.
+    """
+    skip = (page - 1) * page_size
+    total = BidService.count_bids(db=db, status=status, is_active=is_active)
+    pages = (total + page_size - 1) // page_size
+
+    def generate() -> Iterator[bytes]:
+        yield b'{"items":['
+        bids = BidService.iter_bids(
+            db=db,
+            skip=skip,
+            limit=page_size,
+            status=status,
+            is_active=is_active,
+        )
+        for i, bid in enumerate(bids):
+            item = BidResponse.model_validate(bid).model_dump()
+            yield (b"," if i else b"") + orjson.dumps(item)
+        yield (
+            b'],"total":%d,"page":%d,"page_size":%d,"pages":%d}'
+            % (total, page, page_size, pages)
+        )
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 @router.get("/{bid_id}", response_model=BidResponse)
 def get_bid(
     bid_id: int,
@@ -101,6 +158,26 @@ def create_bid(
     return bid
 
 
+@router.post("/bulk", response_model=list[BidResponse], status_code=201)
+def create_bids_bulk(
+    bids_data: list[BidCreate],
+    db: Session = Depends(get_db),
+):
+    """
+    Create multiple bids in one request.
+
+    All bids are inserted in a single transaction — intended for
+    bulk-import flows (CSV upload, integration sync).
+    """
+    if not settings.ENABLE_BID_CALCULATION:
+        raise HTTPException(
+            status_code=403,
+            detail="Bid calculation is currently disabled",
+        )
+
+    return BidService.create_bids_bulk(db, bids_data)
+
+
 @router.put("/{bid_id}", response_model=BidResponse)
 def update_bid(
     bid_id: int,
@@ -152,11 +229,13 @@ def calculate_bid(
 
     result = BidService.calculate_bid_from_cost_codes(
         db=db,
-        line_items=request.line_items,
+        line_items=_CALC_ITEMS_ADAPTER.dump_python(request.line_items, mode="python"),
         tax_rate=request.tax_rate,
     )
 
-    return BidCalculateResponse(**result)
+    # Values are computed server-side from validated inputs; construct
+    # without re-validating to avoid a redundant pydantic pass.
+    return BidCalculateResponse.model_construct(**result)
 
 
 # ROI Analysis Router
@@ -186,4 +265,14 @@ def calculate_roi(
         project_duration_months=request.project_duration_months,
     )
 
-    return ROIAnalysisResponse(**result)
+    # Pure-math endpoint called in tight exploration loops: returning a
+    # Response directly bypasses the response_model validation pass while
+    # response_model above still drives the OpenAPI schema.
+    return ORJSONResponse({
+        "roi_percentage": result["roi_percentage"],
+        "profit": result["profit"],
+        "payback_months": result["payback_months"],
+        "estimated_revenue": result["estimated_revenue"],
+        "estimated_cost": result["estimated_cost"],
+        "net_present_value": None,
+    })
@@ -1,10 +1,12 @@
 """API routes for contextual chain management."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from typing import Optional
 
 from app.database import get_db
+from app.graph import find_cycles
+from app.models.contextual_chain import ContextualChainNode
 from app.services.contextual_service import ContextualLatheringService
 from app.schemas.contextual_chain import (
     ContextualChainNodeCreate,
@@ -76,6 +78,30 @@ def analyze_chain_node(
         raise HTTPException(status_code=500, detail=f"Failed to analyze node: {str(e)}")
 
 
+@router.get("/cycles")
+def list_chain_cycles(db: Session = Depends(get_db)):
+    """
+    Audit the whole chain graph for cycle groups in one pass.
+
+    Registration prevents cycles going forward, but nodes written by
+    imports or older code can still contain them. One Tarjan pass over
+    all parent edges reports every cycle group at once instead of
+    probing edge by edge.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Cycle groups (node ID lists) and their count
+    """
+    rows = db.query(
+        ContextualChainNode.node_id, ContextualChainNode.parent_nodes
+    ).all()
+    graph = {node_id: list(parents or []) for node_id, parents in rows}
+    cycles = find_cycles(graph)
+    return {"cycles": cycles, "total": len(cycles)}
+
+
 @router.get("/bids/{bid_id}/heritage", response_model=ChainAnalysisResponse)
 def get_bid_heritage(
     bid_id: int,
@@ -105,6 +131,41 @@ def get_bid_heritage(
         raise HTTPException(status_code=500, detail=f"Failed to get bid heritage: {str(e)}")
 
 
+@router.get("/bids/{bid_id}/dashboard")
+async def get_bid_dashboard(
+    bid_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Get heritage, chain snapshot, and value flow for a bid in one call.
+
+    The three analyses run concurrently on dedicated sessions, so the
+    response arrives in the time of the slowest one.
+
+    Args:
+        bid_id: Bid ID
+        db: Database session
+
+    Returns:
+        Combined dashboard data
+
+    Raises:
+        HTTPException: If bid not found or analysis fails
+    """
+    from app.services.bid_service import BidService
+
+    try:
+        # Per-task sessions come off the injected session's bind so the
+        # endpoint honors dependency overrides (tests, alternate DBs)
+        # like every other route.
+        session_factory = sessionmaker(bind=db.get_bind())
+        return await BidService.bid_dashboard(bid_id, session_factory=session_factory)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to build dashboard: {str(e)}")
+
+
 @router.get("/snapshots/{node_id}", response_model=ChainSnapshotResponse)
 def get_chain_snapshot(
     node_id: str,
@@ -29,17 +29,45 @@ def list_cost_codes(
     category: Optional[str] = Query(None, description="Filter by category"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search in code, name, or description"),
+    ids: Optional[str] = Query(None, description="Comma-separated cost code IDs to fetch in one call"),
+    after_id: Optional[int] = Query(
+        None, ge=1, description="Keyset cursor — return rows with id below this value"
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Get a list of cost codes with optional filtering and pagination.
-    
+
     - **page**: Page number (starts at 1)
     - **page_size**: Number of items per page
     - **category**: Filter by category
     - **is_active**: Filter by active status
     - **search**: Search term
+    - **ids**: Comma-separated IDs — batch lookup for clients that would
+      otherwise fetch each code individually
+    - **after_id**: Keyset cursor for deep pagination; pass the last id
+      from the previous page (page is ignored when set)
     """
+    if ids:
+        try:
+            id_list = [int(part) for part in ids.split(",") if part.strip()]
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail="ids must be a comma-separated list of integers",
+            )
+
+        cost_code_map = CostCodeService.get_cost_codes_by_ids(db, id_list)
+        items = [cost_code_map[cc_id] for cc_id in id_list if cc_id in cost_code_map]
+
+        return CostCodeList(
+            items=items,
+            total=len(items),
+            page=1,
+            page_size=len(items) or 1,
+            pages=1,
+        )
+
     skip = (page - 1) * page_size
     cost_codes, total = CostCodeService.get_cost_codes(
         db=db,
@@ -48,6 +76,7 @@ def list_cost_codes(
         category=category,
         is_active=is_active,
         search=search,
+        after_id=after_id,
     )
 
     pages = (total + page_size - 1) // page_size
@@ -103,6 +132,30 @@ def create_cost_code(
     return cost_code
 
 
+@router.post("/bulk", response_model=list[CostCodeResponse], status_code=201)
+def create_cost_codes_bulk(
+    cost_codes_data: list[CostCodeCreate],
+    db: Session = Depends(get_db),
+):
+    """
+    Create multiple cost codes in one request.
+
+    All codes are inserted in a single transaction — intended for
+    catalog seeding and import flows that would otherwise POST per row.
+    """
+    # One IN query replaces the per-code existence check
+    existing = CostCodeService.get_cost_codes_by_codes(
+        db, (data.code for data in cost_codes_data)
+    )
+    if existing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cost codes already exist: {', '.join(sorted(existing))}",
+        )
+
+    return CostCodeService.create_cost_codes_bulk(db, cost_codes_data)
+
+
 @router.put("/{cost_code_id}", response_model=CostCodeResponse)
 def update_cost_code(
     cost_code_id: int,
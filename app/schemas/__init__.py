@@ -14,6 +14,7 @@ from app.schemas.bid import (
     BidResponse,
     BidList,
     BidLineItem,
+    BidCalculateLineItem,
     BidCalculateRequest,
     BidCalculateResponse,
     ROIAnalysisRequest,
@@ -38,6 +39,7 @@ __all__ = [
     "BidResponse",
     "BidList",
     "BidLineItem",
+    "BidCalculateLineItem",
     "BidCalculateRequest",
     "BidCalculateResponse",
     "ROIAnalysisRequest",
@@ -1,19 +1,26 @@
 """Bid Pydantic schemas for API validation."""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Literal, Optional, List, Dict, Any
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
-class BidLineItem(BaseModel):
-    """Schema for bid line item."""
+@dataclass(frozen=True, slots=True)
+class BidLineItem:
+    """Schema for bid line item.
+
+    A slotted frozen dataclass rather than a BaseModel: line items are
+    deserialized in bulk (potentially thousands per bid), so the smaller
+    per-instance footprint and offset-based attribute access matter here.
+    """
 
     cost_code_id: int
     cost_code: str
     description: str
-    quantity: float = Field(..., gt=0)
-    unit_price: float = Field(..., ge=0)
-    total: float = Field(..., ge=0)
+    quantity: float = Field(gt=0)
+    unit_price: float = Field(ge=0)
+    total: float = Field(ge=0)
 
 
 class BidBase(BaseModel):
@@ -41,7 +48,7 @@ class BidUpdate(BaseModel):
     project_name: Optional[str] = Field(None, min_length=1, max_length=255)
     client_name: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(draft|submitted|accepted|rejected)$")
+    status: Optional[Literal["draft", "submitted", "accepted", "rejected"]] = None
     tax_rate: Optional[float] = Field(None, ge=0, le=100)
     estimated_revenue: Optional[float] = Field(None, ge=0)
     estimated_cost: Optional[float] = Field(None, ge=0)
@@ -79,10 +86,24 @@ class BidList(BaseModel):
     pages: int
 
 
+class BidCalculateLineItem(BaseModel):
+    """Structural schema for a calculation request line item.
+
+    Validated once at the request boundary (pydantic-core compiles the
+    schema at import) so malformed payloads are rejected before any
+    database work. Extra keys are preserved and passed through.
+    """
+
+    cost_code_id: int
+    quantity: float = Field(default=1, gt=0)
+
+    model_config = {"extra": "allow"}
+
+
 class BidCalculateRequest(BaseModel):
     """Schema for bid calculation request."""
 
-    line_items: List[Dict[str, Any]] = Field(..., min_length=1)
+    line_items: List[BidCalculateLineItem] = Field(..., min_length=1)
     tax_rate: float = Field(default=0.0, ge=0, le=100)
 
 
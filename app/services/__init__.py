@@ -1,12 +1,20 @@
-"""Services package for business logic."""
+"""Services package for business logic.
 
-from app.services.cost_code_service import CostCodeService
-from app.services.bid_service import BidService
-from app.services.contextual_service import (
-    ContextualLatheringEngine,
-    ContextualLatheringService,
-    ContextualChainNodeData,
-)
+Service modules are imported lazily (PEP 562) so workers only pay the
+pydantic/SQLAlchemy import cost for the services they actually use —
+this keeps cold start fast and baseline memory low.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    "CostCodeService": ("app.services.cost_code_service", "CostCodeService"),
+    "BidService": ("app.services.bid_service", "BidService"),
+    "ContextualLatheringEngine": ("app.services.contextual_service", "ContextualLatheringEngine"),
+    "ContextualLatheringService": ("app.services.contextual_service", "ContextualLatheringService"),
+    "ContextualChainNodeData": ("app.services.contextual_service", "ContextualChainNodeData"),
+}
 
 __all__ = [
     "CostCodeService",
@@ -15,3 +23,14 @@ __all__ = [
     "ContextualLatheringService",
     "ContextualChainNodeData",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve service attributes on first access and cache them."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -1,12 +1,72 @@
 """Bid service for business logic."""
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, List, Dict, Any
 from datetime import datetime, timedelta
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import SessionLocal
 from app.models.bid import Bid
+from app.models.contextual_chain import HeritageLineage
 from app.models.cost_code import CostCode
-from app.schemas.bid import BidCreate, BidUpdate
+from app.schemas.bid import BidCreate, BidLineItem, BidUpdate
+from app.services.contextual_service import (
+    ContextualLatheringEngine,
+    ContextualLatheringService,
+)
+from app.services import cost_code_service
+from app.services.cost_code_service import CostCodeService
+
+logger = logging.getLogger(__name__)
+
+# Built once at import so per-request validation/serialization reuses the
+# compiled core schema instead of constructing an adapter per call.
+_LINE_ITEMS_ADAPTER = TypeAdapter(list[BidLineItem])
+
+# Calculation results keyed by ((cost_code_id, quantity), ...) and tax
+# rate. Repeat /bids/calculate calls with the same inputs — common while
+# a user tweaks one line in an estimate — skip both the cost-code query
+# and the recomputation. Any cost-code mutation clears the cache.
+#
+# Invalidation is in-process only: a cost-code write in one worker does
+# not clear sibling workers' caches, and these are money figures, so
+# multi-worker deployments must disable ENABLE_BID_CALC_CACHE.
+_CALC_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_CALC_CACHE_MAX = 256
+
+cost_code_service.register_mutation_listener(_CALC_CACHE.clear)
+
+
+@lru_cache(maxsize=4096)
+def _roi_kernel(
+    estimated_revenue: float,
+    estimated_cost: float,
+    project_duration_months: int,
+) -> tuple[float, float, int, float]:
+    """Pure numeric core of the ROI analysis, memoized on its inputs.
+
+    Parameter sweeps and dashboards re-ask identical questions; repeat
+    calls return the cached tuple without redoing the arithmetic.
+    """
+    profit = estimated_revenue - estimated_cost
+    roi_percentage = (profit / estimated_cost) * 100 if estimated_cost > 0 else 0
+
+    monthly_profit = profit / project_duration_months if project_duration_months > 0 else 0
+    payback_months = int(estimated_cost / monthly_profit) if monthly_profit > 0 else 0
+
+    return (
+        round(roi_percentage, 2),
+        round(profit, 2),
+        payback_months,
+        round(monthly_profit, 2) if monthly_profit > 0 else 0,
+    )
 
 
 class BidService:
@@ -18,10 +78,15 @@ class BidService:
         Generate a unique bid number.
         
         Returns:
-            Bid number in format BID-YYYYMMDD-NNNN
+            Bid number in format BID-YYYYMMDDHHMMSS
         """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"BID-{timestamp}"
+        # Integer field formatting avoids strftime's locale and
+        # format-string parsing; output is byte-identical.
+        now = datetime.now()
+        return (
+            f"BID-{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
 
     @staticmethod
     def get_bid(db: Session, bid_id: int) -> Optional[Bid]:
@@ -35,7 +100,7 @@ class BidService:
         Returns:
             Bid or None if not found
         """
-        return db.query(Bid).filter(Bid.id == bid_id).first()
+        return db.get(Bid, bid_id)
 
     @staticmethod
     def get_bid_by_number(db: Session, bid_number: str) -> Optional[Bid]:
@@ -51,6 +116,21 @@ class BidService:
         """
         return db.query(Bid).filter(Bid.bid_number == bid_number).first()
 
+    @staticmethod
+    def _bid_filters(
+        status: Optional[str] = None, is_active: Optional[bool] = None
+    ) -> List[Any]:
+        """Build the shared filter list for bid listing queries."""
+        filters = []
+
+        if status:
+            filters.append(Bid.status == status)
+
+        if is_active is not None:
+            filters.append(Bid.is_active == is_active)
+
+        return filters
+
     @staticmethod
     def get_bids(
         db: Session,
@@ -61,29 +141,92 @@ class BidService:
     ) -> tuple[List[Bid], int]:
         """
         Get a list of bids with optional filtering.
-        
+
         Args:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
             is_active: Filter by active status
-            
+
         Returns:
             Tuple of (bids list, total count)
         """
-        query = db.query(Bid)
+        filters = BidService._bid_filters(status, is_active)
+
+        # COUNT(*) OVER () returns the page and the filtered total in a
+        # single statement instead of a separate count() round trip.
+        rows = (
+            db.query(Bid, func.count().over().label("total"))
+            .filter(*filters)
+            .order_by(Bid.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
-        if status:
-            query = query.filter(Bid.status == status)
+        if rows:
+            return [row.Bid for row in rows], rows[0].total
 
-        if is_active is not None:
-            query = query.filter(Bid.is_active == is_active)
+        # Page ran past the end of the result set; fall back to a bare
+        # count so callers still see the true total.
+        total = db.query(func.count(Bid.id)).filter(*filters).scalar() or 0
+        return [], total
+
+    @staticmethod
+    def count_bids(
+        db: Session,
+        status: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> int:
+        """
+        Count bids matching the listing filters.
 
-        total = query.count()
-        bids = query.order_by(Bid.created_at.desc()).offset(skip).limit(limit).all()
+        Args:
+            db: Database session
+            status: Filter by status
+            is_active: Filter by active status
 
-        return bids, total
+        Returns:
+            Number of matching bids
+        """
+        filters = BidService._bid_filters(status, is_active)
+        return db.query(func.count(Bid.id)).filter(*filters).scalar() or 0
+
+    @staticmethod
+    def iter_bids(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> Iterator[Bid]:
+        """
+        Iterate over a page of bids without materializing it up front.
+
+        yield_per keeps only a batch of rows hydrated at a time, so
+        streaming consumers hold one batch in memory instead of the
+        whole page.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            status: Filter by status
+            is_active: Filter by active status
+
+        Yields:
+            Bid rows in created_at-descending order
+        """
+        filters = BidService._bid_filters(status, is_active)
+        yield from (
+            db.query(Bid)
+            .filter(*filters)
+            .order_by(Bid.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .yield_per(100)
+        )
 
     @staticmethod
     def create_bid(db: Session, bid_data: BidCreate) -> Bid:
@@ -97,8 +240,8 @@ class BidService:
         Returns:
             Created Bid
         """
-        # Convert line items to dict format
-        line_items_data = [item.model_dump() for item in bid_data.line_items]
+        # Convert line items to dict format in one adapter-level pass
+        line_items_data = _LINE_ITEMS_ADAPTER.dump_python(bid_data.line_items, mode="python")
 
         # Create bid
         db_bid = Bid(
@@ -124,9 +267,58 @@ class BidService:
 
         db.add(db_bid)
         db.commit()
-        db.refresh(db_bid)
         return db_bid
 
+    @staticmethod
+    def create_bids_bulk(db: Session, bids_data: List[BidCreate]) -> List[Bid]:
+        """
+        Create multiple bids in a single transaction.
+
+        Builds every Bid in memory, adds them in one batch and commits
+        once, instead of paying an add/commit/refresh round trip per bid.
+        The batch prefix carries a nanosecond timestamp and each bid a
+        per-batch index, so neither same-second batches nor rows within
+        a batch can collide on bid_number.
+
+        Args:
+            db: Database session
+            bids_data: List of bid data
+
+        Returns:
+            List of created Bids
+        """
+        # The second-granularity generate_bid_number format would repeat
+        # for back-to-back imports; time_ns is monotonic enough that two
+        # batches in one process can't share a prefix.
+        batch_prefix = f"BID-{time.time_ns()}"
+        db_bids = []
+
+        for index, bid_data in enumerate(bids_data):
+            db_bid = Bid(
+                bid_number=f"{batch_prefix}-{index:04d}",
+                project_name=bid_data.project_name,
+                client_name=bid_data.client_name,
+                description=bid_data.description,
+                tax_rate=bid_data.tax_rate,
+                estimated_revenue=bid_data.estimated_revenue,
+                estimated_cost=bid_data.estimated_cost,
+                notes=bid_data.notes,
+                valid_until=bid_data.valid_until,
+                line_items=_LINE_ITEMS_ADAPTER.dump_python(bid_data.line_items, mode="python"),
+            )
+
+            db_bid.calculate_totals()
+
+            if db_bid.estimated_revenue and db_bid.estimated_cost:
+                roi_data = db_bid.calculate_roi()
+                db_bid.estimated_roi_percentage = roi_data.get("roi_percentage")
+
+            db_bids.append(db_bid)
+
+        db.add_all(db_bids)
+        db.commit()
+        return db_bids
+
     @staticmethod
     def update_bid(db: Session, bid_id: int, bid_data: BidUpdate) -> Optional[Bid]:
         """
@@ -144,15 +336,10 @@ class BidService:
         if not db_bid:
             return None
 
+        # model_dump already serializes nested line items to plain dicts,
+        # so no per-item conversion is needed here.
         update_data = bid_data.model_dump(exclude_unset=True)
 
-        # Handle line items separately
-        if "line_items" in update_data and update_data["line_items"]:
-            update_data["line_items"] = [
-                item.model_dump() if hasattr(item, "model_dump") else item
-                for item in update_data["line_items"]
-            ]
-
         for field, value in update_data.items():
             setattr(db_bid, field, value)
 
@@ -167,7 +354,6 @@ class BidService:
                 db_bid.estimated_roi_percentage = roi_data.get("roi_percentage")
 
         db.commit()
-        db.refresh(db_bid)
         return db_bid
 
     @staticmethod
@@ -182,13 +368,16 @@ class BidService:
         Returns:
             True if deleted, False if not found
         """
-        db_bid = BidService.get_bid(db, bid_id)
-        if not db_bid:
-            return False
-
-        db_bid.is_active = False
+        # Single UPDATE instead of read-then-write: no row hydration and
+        # one round trip. Filtering on id alone keeps the delete
+        # idempotent — re-deleting an inactive bid still reports found.
+        rows = (
+            db.query(Bid)
+            .filter(Bid.id == bid_id)
+            .update({"is_active": False}, synchronize_session=False)
+        )
         db.commit()
-        return True
+        return rows > 0
 
     @staticmethod
     def calculate_bid_from_cost_codes(
@@ -205,19 +394,44 @@ class BidService:
         Returns:
             Dictionary with calculated bid data
         """
+        # Identical inputs produce identical output until a cost code
+        # changes, so serve repeats from the module cache. Callers treat
+        # the result as read-only (routes serialize it straight into the
+        # response).
+        cache_key = None
+        if settings.ENABLE_BID_CALC_CACHE:
+            cache_key = (
+                tuple(
+                    (item.get("cost_code_id"), item.get("quantity", 1))
+                    for item in line_items
+                ),
+                tax_rate,
+            )
+            cached = _CALC_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # One IN query for all referenced cost codes instead of a lookup
+        # per line item.
+        cost_code_map = CostCodeService.get_cost_codes_by_ids(
+            db, (item.get("cost_code_id") for item in line_items if item.get("cost_code_id"))
+        )
+
+        # Money math runs in integer cents: totals accumulate exactly and
+        # the per-line round(..., 2) calls disappear from the hot loop.
         calculated_items = []
-        subtotal = 0.0
+        subtotal_cents = 0
 
         for item in line_items:
             cost_code_id = item.get("cost_code_id")
             quantity = item.get("quantity", 1)
 
-            cost_code = db.query(CostCode).filter(CostCode.id == cost_code_id).first()
+            cost_code = cost_code_map.get(cost_code_id)
             if not cost_code:
                 continue
 
-            line_total = cost_code.calculate_total_cost(quantity)
-            subtotal += line_total
+            line_total_cents = round(cost_code.calculate_total_cost(quantity) * 100)
+            subtotal_cents += line_total_cents
 
             calculated_items.append({
                 "cost_code_id": cost_code.id,
@@ -226,19 +440,24 @@ class BidService:
                 "quantity": quantity,
                 "unit": cost_code.unit,
                 "unit_price": cost_code.unit_price,
-                "total": round(line_total, 2),
+                "total": line_total_cents / 100.0,
             })
 
-        tax_amount = subtotal * (tax_rate / 100)
-        total_amount = subtotal + tax_amount
+        tax_cents = round(subtotal_cents * tax_rate / 100)
 
-        return {
+        result = {
             "line_items": calculated_items,
-            "subtotal": round(subtotal, 2),
-            "tax_amount": round(tax_amount, 2),
-            "total_amount": round(total_amount, 2),
+            "subtotal": subtotal_cents / 100.0,
+            "tax_amount": tax_cents / 100.0,
+            "total_amount": (subtotal_cents + tax_cents) / 100.0,
         }
 
+        if cache_key is not None:
+            if len(_CALC_CACHE) >= _CALC_CACHE_MAX:
+                _CALC_CACHE.clear()
+            _CALC_CACHE[cache_key] = result
+        return result
+
     @staticmethod
     def calculate_roi_analysis(
         estimated_revenue: float,
@@ -256,22 +475,17 @@ class BidService:
         Returns:
             Dictionary with ROI analysis
         """
-        profit = estimated_revenue - estimated_cost
-        roi_percentage = (profit / estimated_cost) * 100 if estimated_cost > 0 else 0
-        
-        # Calculate payback period in months
-        monthly_profit = profit / project_duration_months if project_duration_months > 0 else 0
-        payback_months = (
-            int(estimated_cost / monthly_profit) if monthly_profit > 0 else 0
+        roi_percentage, profit, payback_months, monthly_profit = _roi_kernel(
+            estimated_revenue, estimated_cost, project_duration_months
         )
 
         return {
-            "roi_percentage": round(roi_percentage, 2),
-            "profit": round(profit, 2),
+            "roi_percentage": roi_percentage,
+            "profit": profit,
             "payback_months": payback_months,
             "estimated_revenue": estimated_revenue,
             "estimated_cost": estimated_cost,
-            "monthly_profit": round(monthly_profit, 2) if monthly_profit > 0 else 0,
+            "monthly_profit": monthly_profit,
         }
     
     @staticmethod
@@ -291,9 +505,6 @@ class BidService:
         Returns:
             Tuple of (created bid, contextual node)
         """
-        from app.services.contextual_service import ContextualLatheringService
-        from app.config import settings
-        
         # Create the bid using standard method
         bid = BidService.create_bid(db, bid_data)
         
@@ -325,8 +536,6 @@ class BidService:
                 )
             except Exception as e:
                 # Log error but don't fail bid creation
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to create contextual node for bid {bid.id}: {e}")
         
         return bid, contextual_node
@@ -343,8 +552,6 @@ class BidService:
         Returns:
             Dictionary with heritage analysis
         """
-        from app.services.contextual_service import ContextualLatheringService
-        
         node_id = f"bid-{bid_id}"
         return ContextualLatheringService.get_node_analysis(db, node_id)
     
@@ -360,8 +567,6 @@ class BidService:
         Returns:
             Chain snapshot dictionary
         """
-        from app.services.contextual_service import ContextualLatheringService
-        
         node_id = f"bid-{bid_id}"
         return ContextualLatheringService.get_chain_snapshot(db, node_id)
     
@@ -377,8 +582,6 @@ class BidService:
         Returns:
             Dictionary with value flow analysis
         """
-        from app.services.contextual_service import ContextualLatheringEngine
-        
         bid = BidService.get_bid(db, bid_id)
         if not bid:
             return {"error": "Bid not found"}
@@ -390,29 +593,36 @@ class BidService:
             # Get heritage lineage
             lineage = engine.get_heritage_lineage(node_id)
             
-            # Calculate total value from cost codes in chain
+            # Calculate total value from cost codes in chain. The JSON
+            # column always holds dicts, so narrow once up front and keep
+            # the hot loop free of per-item isinstance checks.
             total_chain_value = 0.0
             cost_code_values = {}
-            
-            if bid.line_items:
-                from app.models.cost_code import CostCode
-                
-                for item in bid.line_items:
-                    if isinstance(item, dict) and "cost_code_id" in item:
-                        cost_code_id = item["cost_code_id"]
-                        cost_code = db.query(CostCode).filter(
-                            CostCode.id == cost_code_id
-                        ).first()
-                        
-                        if cost_code:
-                            item_total = item.get("total", 0)
-                            total_chain_value += item_total
-                            cost_code_values[f"cost-code-{cost_code_id}"] = {
-                                "code": cost_code.code,
-                                "name": cost_code.name,
-                                "value": item_total,
-                                "quantity": item.get("quantity", 0),
-                            }
+
+            line_items = [
+                item
+                for item in (bid.line_items or [])
+                if isinstance(item, dict) and "cost_code_id" in item
+            ]
+
+            if line_items:
+                cost_code_map = CostCodeService.get_cost_codes_by_ids(
+                    db, (item["cost_code_id"] for item in line_items)
+                )
+
+                for item in line_items:
+                    cost_code_id = item["cost_code_id"]
+                    cost_code = cost_code_map.get(cost_code_id)
+
+                    if cost_code:
+                        item_total = item.get("total", 0)
+                        total_chain_value += item_total
+                        cost_code_values[f"cost-code-{cost_code_id}"] = {
+                            "code": cost_code.code,
+                            "name": cost_code.name,
+                            "value": item_total,
+                            "quantity": item.get("quantity", 0),
+                        }
             
             return {
                 "bid_id": bid_id,
@@ -427,10 +637,158 @@ class BidService:
                 ),
             }
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Failed to calculate chain value flow: {e}")
             return {
                 "error": str(e),
                 "bid_id": bid_id,
             }
+
+    @staticmethod
+    def get_bids_value_flow(db: Session, bid_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Calculate value flow for many bids with a fixed number of queries.
+
+        Dashboards that loop get_bid + calculate_chain_value_flow issue
+        a set of queries per bid. This batched variant fetches all bids,
+        all their lineage rows, and all referenced cost codes in one
+        query each, then computes per-bid value flow from the loaded
+        data — three queries regardless of how many bids are requested.
+
+        Args:
+            db: Database session
+            bid_ids: Bid IDs to analyze
+
+        Returns:
+            Mapping of bid ID to its value-flow dictionary (missing bids
+            are omitted)
+        """
+        if not bid_ids:
+            return {}
+
+        bids = db.query(Bid).filter(Bid.id.in_(bid_ids)).all()
+        if not bids:
+            return {}
+
+        # All lineage rows for every bid node in one query, grouped by
+        # descendant and kept in depth order.
+        node_ids = [f"bid-{bid.id}" for bid in bids]
+        lineage_map: Dict[str, List[str]] = {node_id: [] for node_id in node_ids}
+        lineage_rows = (
+            db.query(HeritageLineage)
+            .filter(HeritageLineage.descendant_node_id.in_(node_ids))
+            .order_by(HeritageLineage.depth_distance)
+            .all()
+        )
+        for row in lineage_rows:
+            lineage_map[row.descendant_node_id].append(row.ancestor_node_id)
+
+        # Every cost code referenced by any bid, fetched in one IN query.
+        all_line_items = {
+            bid.id: [
+                item
+                for item in (bid.line_items or [])
+                if isinstance(item, dict) and "cost_code_id" in item
+            ]
+            for bid in bids
+        }
+        cost_code_map = CostCodeService.get_cost_codes_by_ids(
+            db,
+            (
+                item["cost_code_id"]
+                for items in all_line_items.values()
+                for item in items
+            ),
+        )
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for bid in bids:
+            total_chain_value = 0.0
+            cost_code_values = {}
+
+            for item in all_line_items[bid.id]:
+                cost_code_id = item["cost_code_id"]
+                cost_code = cost_code_map.get(cost_code_id)
+
+                if cost_code:
+                    item_total = item.get("total", 0)
+                    total_chain_value += item_total
+                    cost_code_values[f"cost-code-{cost_code_id}"] = {
+                        "code": cost_code.code,
+                        "name": cost_code.name,
+                        "value": item_total,
+                        "quantity": item.get("quantity", 0),
+                    }
+
+            lineage = lineage_map[f"bid-{bid.id}"]
+            results[bid.id] = {
+                "bid_id": bid.id,
+                "bid_total": bid.total_amount or 0,
+                "chain_depth": len(lineage),
+                "heritage_nodes": lineage,
+                "cost_code_values": cost_code_values,
+                "total_chain_value": total_chain_value,
+                "value_concentration": (
+                    total_chain_value / bid.total_amount * 100
+                    if bid.total_amount and bid.total_amount > 0 else 0
+                ),
+            }
+
+        return results
+
+    @staticmethod
+    async def bid_dashboard(
+        bid_id: int,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> Dict[str, Any]:
+        """
+        Gather heritage, chain snapshot, and value flow for a bid concurrently.
+
+        The three reads are independent and I/O-bound, so dashboards that
+        need all of them wait max(three) instead of sum(three). Sessions
+        are not thread-safe, so each task runs on its own session from
+        session_factory.
+
+        Args:
+            bid_id: Bid ID
+            session_factory: Factory producing a fresh database session
+
+        Returns:
+            Dictionary with heritage, chain_snapshot, and value_flow keys
+        """
+        loop = asyncio.get_running_loop()
+
+        def in_session(func: Callable[[Session, int], Dict[str, Any]]):
+            def task() -> Dict[str, Any]:
+                db = session_factory()
+                try:
+                    return func(db, bid_id)
+                finally:
+                    db.close()
+
+            return task
+
+        tasks = [
+            in_session(BidService.analyze_bid_heritage),
+            in_session(BidService.get_chain_snapshot),
+            in_session(BidService.calculate_chain_value_flow),
+        ]
+
+        # A factory bound to a single Connection (rather than an engine
+        # with a pool) cannot serve overlapping sessions; run the reads
+        # one after another on it instead of racing threads over one
+        # DBAPI connection.
+        bind = getattr(session_factory, "kw", {}).get("bind")
+        if isinstance(bind, Connection):
+            results = [await loop.run_in_executor(None, task) for task in tasks]
+        else:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, task) for task in tasks)
+            )
+        heritage, chain_snapshot, value_flow = results
+
+        return {
+            "bid_id": bid_id,
+            "heritage": heritage,
+            "chain_snapshot": chain_snapshot,
+            "value_flow": value_flow,
+        }
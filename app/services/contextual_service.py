@@ -1,21 +1,33 @@
 """Contextual lathering service for heritage tracking and chain analysis."""
 
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, bindparam, func, insert, literal, select
 
 from app.models.contextual_chain import ContextualChainNode, HeritageLineage
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so every node lookup reuses the same statement
+# object (and its compiled-cache entry) instead of reconstructing the
+# select per call.
+_NODE_BY_ID = select(ContextualChainNode).where(
+    ContextualChainNode.node_id == bindparam("nid")
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ContextualChainNodeData:
-    """Data structure representing a node in the intermodular chain."""
+    """Data structure representing a node in the intermodular chain.
+
+    slots=True drops the per-instance __dict__, shrinking each node and
+    speeding attribute access for bulk registrations.
+    """
     
     node_id: str
     node_type: str
@@ -36,25 +48,76 @@ class ContextualLatheringEngine:
             db: Database session
         """
         self.db = db
-    
-    def register_node(self, node: ContextualChainNodeData) -> str:
+        # Engines are short-lived (one per service call), so a plain dict
+        # keyed on node_id is safe and saves the repeated one-shot node
+        # SELECT that nearly every public method opens with.
+        self._node_cache: Dict[str, ContextualChainNode] = {}
+        # Parent -> children edges registered through this engine, used to
+        # catch cycles among nodes added in the same batch before their
+        # closure rows are necessarily visible.
+        self._pending_edges: Dict[str, List[str]] = {}
+        # Incremental transitive closure over the same batch: each node
+        # maps to an int bitset of its ancestors (bit positions assigned
+        # on first sight), so repeat cycle checks reject an edge with a
+        # couple of bitwise ANDs instead of re-walking the graph.
+        self._bit_index: Dict[str, int] = {}
+        self._ancestor_bits: Dict[str, int] = {}
+        # Bulk loads register many nodes under the same parent set; the
+        # union of those parents' ancestor bitsets is cached per parent
+        # set so re-validating an already-seen subgraph skips the union.
+        self._ancestor_union_cache: Dict[frozenset, int] = {}
+
+    def _bit_for(self, node_id: str) -> int:
+        """
+        Return the bitmask assigned to a node ID, allocating on first use.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Single-bit int mask identifying the node
+        """
+        index = self._bit_index.get(node_id)
+        if index is None:
+            index = len(self._bit_index)
+            self._bit_index[node_id] = index
+        return 1 << index
+
+    def _get_node(self, node_id: str) -> Optional[ContextualChainNode]:
+        """
+        Fetch a node by ID, memoized for the engine's lifetime.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            ContextualChainNode or None if not found
+        """
+        node = self._node_cache.get(node_id)
+        if node is None:
+            node = self.db.execute(
+                _NODE_BY_ID, {"nid": node_id}
+            ).scalar_one_or_none()
+            if node is not None:
+                self._node_cache[node_id] = node
+        return node
+
+    def register_node(self, node: ContextualChainNodeData) -> ContextualChainNode:
         """
         Register a new node in the contextual chain.
-        
+
         Args:
             node: Contextual chain node data
-            
+
         Returns:
-            Node ID of the registered node
-            
+            The registered ContextualChainNode
+
         Raises:
             ValueError: If node already exists or circular dependency detected
         """
         # Check if node already exists
-        existing = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node.node_id
-        ).first()
-        
+        existing = self._get_node(node.node_id)
+
         if existing:
             raise ValueError(f"Node with ID {node.node_id} already exists")
         
@@ -90,9 +153,35 @@ class ContextualLatheringEngine:
         self._create_heritage_entries(node.node_id, node.parent_nodes, depth)
         
         self.db.commit()
+        self._node_cache[node.node_id] = db_node
+        for parent_id in node.parent_nodes:
+            self._pending_edges.setdefault(parent_id, []).append(node.node_id)
+
+        parents_key = frozenset(node.parent_nodes)
+        ancestor_bits = self._ancestor_union_cache.get(parents_key)
+        if ancestor_bits is None:
+            ancestor_bits = 0
+            for parent_id in node.parent_nodes:
+                ancestor_bits |= self._bit_for(parent_id) | self._ancestor_bits.get(
+                    parent_id, 0
+                )
+            self._ancestor_union_cache[parents_key] = ancestor_bits
+        self._ancestor_bits[node.node_id] = ancestor_bits
+
+        # The new node's own ancestry just became known, so any cached
+        # union that lists it as a parent is stale.
+        if self._ancestor_union_cache:
+            self._ancestor_union_cache = {
+                key: bits
+                for key, bits in self._ancestor_union_cache.items()
+                if node.node_id not in key
+            }
+        # New lineage rows may extend cached chains; drop the cache so
+        # later lookups in this request see the fresh entries.
+        self.db.info.pop("lineage_cache", None)
         logger.info(f"Registered node {node.node_id} with depth {depth}")
-        
-        return node.node_id
+
+        return db_node
     
     def calculate_lathering_depth(self, node_id: str) -> int:
         """
@@ -107,13 +196,11 @@ class ContextualLatheringEngine:
         Raises:
             ValueError: If node not found
         """
-        node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
-        
+        node = self._get_node(node_id)
+
         if not node:
             raise ValueError(f"Node {node_id} not found")
-        
+
         return node.lathering_depth
     
     def get_heritage_lineage(self, node_id: str) -> List[str]:
@@ -125,23 +212,80 @@ class ContextualLatheringEngine:
             
         Returns:
             List of ancestor node IDs ordered by depth (closest to furthest)
-            
+
         Raises:
             ValueError: If node not found
         """
-        node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
-        
+        # Session.info lives for the request (sessions are per-request via
+        # get_db), so repeated lineage lookups for the same node — e.g. a
+        # dashboard fetching heritage, snapshot, and value flow together —
+        # walk the lineage table only once.
+        cache = self.db.info.setdefault("lineage_cache", {})
+        if node_id in cache:
+            return list(cache[node_id])
+
+        node = self._get_node(node_id)
+
         if not node:
             raise ValueError(f"Node {node_id} not found")
-        
-        # Query all ancestors ordered by depth
-        lineage = self.db.query(HeritageLineage).filter(
-            HeritageLineage.descendant_node_id == node_id
-        ).order_by(HeritageLineage.depth_distance).all()
-        
-        return [entry.ancestor_node_id for entry in lineage]
+
+        # Query all ancestors ordered by depth; only one column is
+        # needed, so a scalar select skips hydrating full ORM rows into
+        # the identity map.
+        result = list(
+            self.db.execute(
+                select(HeritageLineage.ancestor_node_id)
+                .where(HeritageLineage.descendant_node_id == node_id)
+                .order_by(HeritageLineage.depth_distance)
+            ).scalars()
+        )
+
+        # Closure rows can be missing for nodes written outside the
+        # engine (imports, stale deployments); fall back to walking
+        # parent_nodes so lineage still resolves.
+        if not result and node.parent_nodes:
+            result = self._lineage_via_parent_walk(node)
+
+        cache[node_id] = result
+        return list(result)
+
+    def _lineage_via_parent_walk(self, node: ContextualChainNode) -> List[str]:
+        """
+        Derive a node's ancestors by walking parent_nodes level by level.
+
+        Fallback for when the closure table has no rows for the node.
+        Each generation is resolved with one IN query over the frontier,
+        so the traversal costs one round trip per level rather than one
+        per ancestor. Order matches the closure query: closest ancestors
+        first.
+
+        Args:
+            node: Node whose lineage is being derived
+
+        Returns:
+            List of ancestor node IDs ordered by depth
+        """
+        lineage: List[str] = []
+        seen: Set[str] = {node.node_id}
+        frontier = [p for p in node.parent_nodes or [] if p not in seen]
+
+        while frontier:
+            seen.update(frontier)
+            lineage.extend(frontier)
+
+            rows = self.db.query(ContextualChainNode.parent_nodes).filter(
+                ContextualChainNode.node_id.in_(frontier)
+            ).all()
+
+            next_frontier: List[str] = []
+            for (parents,) in rows:
+                for parent_id in parents or []:
+                    if parent_id not in seen:
+                        seen.add(parent_id)
+                        next_frontier.append(parent_id)
+            frontier = next_frontier
+
+        return lineage
     
     def analyze_chain_metrics(self, node_id: str) -> Dict[str, Any]:
         """
@@ -156,38 +300,55 @@ class ContextualLatheringEngine:
         Raises:
             ValueError: If node not found
         """
-        node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
-        
+        node = self._get_node(node_id)
+
         if not node:
             raise ValueError(f"Node {node_id} not found")
-        
-        # Get heritage lineage
-        lineage = self.get_heritage_lineage(node_id)
-        
+
         # Count descendants
-        descendants_count = self.db.query(HeritageLineage).filter(
+        descendants_count = self.db.query(func.count(HeritageLineage.id)).filter(
             HeritageLineage.ancestor_node_id == node_id
-        ).count()
-        
-        # Get node type distribution in lineage
-        if lineage:
-            ancestor_nodes = self.db.query(ContextualChainNode).filter(
-                ContextualChainNode.node_id.in_(lineage)
-            ).all()
-            node_type_distribution = {}
-            for ancestor in ancestor_nodes:
-                node_type_distribution[ancestor.node_type] = \
-                    node_type_distribution.get(ancestor.node_type, 0) + 1
-        else:
-            node_type_distribution = {}
-        
+        ).scalar() or 0
+
+        return self._chain_metrics(node, descendants_count)
+
+    def _chain_metrics(
+        self, node: ContextualChainNode, descendants_count: int
+    ) -> Dict[str, Any]:
+        """
+        Build the metrics dict from an already-loaded node and count.
+
+        Shared by analyze_chain_metrics and get_chain_snapshot so the
+        snapshot path can reuse its own node and descendant aggregate
+        instead of re-querying both.
+
+        Args:
+            node: Loaded node to analyze
+            descendants_count: Precomputed descendant count for the node
+
+        Returns:
+            Dictionary containing chain metrics
+        """
+        # Ancestor count and type distribution in one GROUP BY over the
+        # closure-table join, instead of fetching the full lineage and
+        # every ancestor row just to tally types in Python.
+        type_rows = self.db.query(
+            ContextualChainNode.node_type, func.count()
+        ).join(
+            HeritageLineage,
+            HeritageLineage.ancestor_node_id == ContextualChainNode.node_id,
+        ).filter(
+            HeritageLineage.descendant_node_id == node.node_id
+        ).group_by(ContextualChainNode.node_type).all()
+
+        node_type_distribution = dict(type_rows)
+        total_ancestors = sum(node_type_distribution.values())
+
         return {
-            "node_id": node_id,
+            "node_id": node.node_id,
             "node_type": node.node_type,
             "lathering_depth": node.lathering_depth,
-            "total_ancestors": len(lineage),
+            "total_ancestors": total_ancestors,
             "total_descendants": descendants_count,
             "node_type_distribution": node_type_distribution,
             "parent_nodes": node.parent_nodes,
@@ -206,13 +367,11 @@ class ContextualLatheringEngine:
         Returns:
             True if circular dependency detected, False otherwise
         """
-        node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
-        
+        node = self._get_node(node_id)
+
         if not node:
             return False
-        
+
         return self._would_create_cycle(node_id, node.parent_nodes)
     
     def get_chain_snapshot(
@@ -233,42 +392,50 @@ class ContextualLatheringEngine:
         Raises:
             ValueError: If node not found
         """
-        root_node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == root_node_id
-        ).first()
-        
+        root_node = self._get_node(root_node_id)
+
         if not root_node:
             raise ValueError(f"Root node {root_node_id} not found")
         
         # Build the tree structure
         node_tree = self._build_node_tree(root_node_id)
-        
-        # Calculate total nodes and max depth
-        all_descendants = self.db.query(HeritageLineage).filter(
+
+        # Total nodes and max depth as one server-side aggregate instead
+        # of shipping every descendant row (and node) over just to take a
+        # max/len in Python.
+        max_descendant_depth, descendant_count = self.db.query(
+            func.max(ContextualChainNode.lathering_depth), func.count()
+        ).join(
+            HeritageLineage,
+            HeritageLineage.descendant_node_id == ContextualChainNode.node_id,
+        ).filter(
             HeritageLineage.ancestor_node_id == root_node_id
-        ).all()
-        
-        max_depth = root_node.lathering_depth
-        if all_descendants:
-            descendant_ids = [d.descendant_node_id for d in all_descendants]
-            descendant_nodes = self.db.query(ContextualChainNode).filter(
-                ContextualChainNode.node_id.in_(descendant_ids)
-            ).all()
-            if descendant_nodes:
-                max_depth = max(n.lathering_depth for n in descendant_nodes)
-        
+        ).one()
+
+        max_depth = (
+            max_descendant_depth
+            if max_descendant_depth is not None
+            else root_node.lathering_depth
+        )
+
         snapshot = {
-            "snapshot_id": f"SNAP-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            # time_ns skips the datetime + strftime formatting path and
+            # gives same-second snapshots distinct IDs as a bonus.
+            "snapshot_id": f"SNAP-{time.time_ns()}",
             "root_node": root_node_id,
-            "total_nodes": len(all_descendants) + 1,  # +1 for root
+            "total_nodes": (descendant_count or 0) + 1,  # +1 for root
             "max_depth": max_depth,
             "node_tree": node_tree,
             "generated_at": datetime.now(),
         }
         
         if include_metrics:
-            snapshot["metrics"] = self.analyze_chain_metrics(root_node_id)
-        
+            # The root node and its descendant count are already in hand;
+            # skip analyze_chain_metrics' node lookup and COUNT query.
+            snapshot["metrics"] = self._chain_metrics(
+                root_node, descendant_count or 0
+            )
+
         return snapshot
     
     def _calculate_depth(self, parent_nodes: List[str]) -> int:
@@ -283,17 +450,24 @@ class ContextualLatheringEngine:
         """
         if not parent_nodes:
             return 0
-        
-        # Get max depth from all parents and add 1
-        parent_depths = self.db.query(ContextualChainNode.lathering_depth).filter(
-            ContextualChainNode.node_id.in_(parent_nodes)
-        ).all()
-        
-        if not parent_depths:
+
+        # Reuse parent rows already in the per-engine cache and fetch any
+        # missing ones with a single IN query; the fetched rows also seed
+        # _get_node for the rest of the call.
+        missing = [p for p in parent_nodes if p not in self._node_cache]
+        if missing:
+            for row in self.db.query(ContextualChainNode).filter(
+                ContextualChainNode.node_id.in_(missing)
+            ).all():
+                self._node_cache[row.node_id] = row
+
+        parents = [
+            self._node_cache[p] for p in parent_nodes if p in self._node_cache
+        ]
+        if not parents:
             return 1
-        
-        max_parent_depth = max(depth[0] for depth in parent_depths)
-        return max_parent_depth + 1
+
+        return max(parent.lathering_depth for parent in parents) + 1
     
     def _create_heritage_entries(
         self,
@@ -309,28 +483,46 @@ class ContextualLatheringEngine:
             parent_nodes: List of parent node IDs
             node_depth: Depth of the new node
         """
-        # Direct parent relationships
-        for parent_id in parent_nodes:
-            lineage = HeritageLineage(
-                ancestor_node_id=parent_id,
-                descendant_node_id=node_id,
-                depth_distance=1
+        if not parent_nodes:
+            return
+
+        # Direct parent relationships in one executemany insert
+        self.db.execute(
+            insert(HeritageLineage),
+            [
+                {
+                    "ancestor_node_id": parent_id,
+                    "descendant_node_id": node_id,
+                    "depth_distance": 1,
+                }
+                for parent_id in parent_nodes
+            ],
+        )
+
+        # Inherit all transitive ancestors with a single INSERT..SELECT
+        # instead of one SELECT per parent plus per-row adds. GROUP BY
+        # collapses ancestors reachable through several parents (diamond
+        # fan-in) to their shortest distance, and excluding the direct
+        # parents keeps (ancestor, descendant) unique alongside the rows
+        # written above.
+        transitive = (
+            select(
+                HeritageLineage.ancestor_node_id,
+                literal(node_id),
+                func.min(HeritageLineage.depth_distance) + 1,
             )
-            self.db.add(lineage)
-        
-        # Inherit all ancestor relationships
-        for parent_id in parent_nodes:
-            parent_ancestors = self.db.query(HeritageLineage).filter(
-                HeritageLineage.descendant_node_id == parent_id
-            ).all()
-            
-            for ancestor in parent_ancestors:
-                lineage = HeritageLineage(
-                    ancestor_node_id=ancestor.ancestor_node_id,
-                    descendant_node_id=node_id,
-                    depth_distance=ancestor.depth_distance + 1
-                )
-                self.db.add(lineage)
+            .where(
+                HeritageLineage.descendant_node_id.in_(parent_nodes),
+                HeritageLineage.ancestor_node_id.notin_(parent_nodes),
+            )
+            .group_by(HeritageLineage.ancestor_node_id)
+        )
+        self.db.execute(
+            insert(HeritageLineage).from_select(
+                ["ancestor_node_id", "descendant_node_id", "depth_distance"],
+                transitive,
+            )
+        )
     
     def _would_create_cycle(self, node_id: str, parent_nodes: List[str]) -> bool:
         """
@@ -343,66 +535,174 @@ class ContextualLatheringEngine:
         Returns:
             True if cycle would be created
         """
+        if not parent_nodes:
+            return False
+
         # If node_id is in parent_nodes, direct cycle
         if node_id in parent_nodes:
             return True
-        
-        # Check if any parent is a descendant of this node
-        for parent_id in parent_nodes:
-            descendants = self.db.query(HeritageLineage).filter(
-                HeritageLineage.ancestor_node_id == node_id,
-                HeritageLineage.descendant_node_id == parent_id
-            ).first()
-            
-            if descendants:
-                return True
-        
+
+        # One IN query decides whether any parent is a descendant of this
+        # node; the closure table makes the per-parent probes redundant.
+        descendant_parent = self.db.query(HeritageLineage.id).filter(
+            HeritageLineage.ancestor_node_id == node_id,
+            HeritageLineage.descendant_node_id.in_(parent_nodes),
+        ).first()
+
+        if descendant_parent is not None:
+            return True
+
+        # O(1) rejection for batch-registered nodes: if any proposed
+        # parent already counts this node among its ancestors, the edge
+        # closes a cycle. The bitsets are unions built incrementally at
+        # registration, so no traversal happens here.
+        if self._ancestor_bits:
+            node_bit = self._bit_for(node_id)
+            for parent_id in parent_nodes:
+                if self._ancestor_bits.get(parent_id, 0) & node_bit:
+                    return True
+
+        # Iterative DFS over edges registered through this engine covers
+        # batch scenarios where a sibling's closure rows are not yet
+        # queryable; a back edge reaching any proposed parent is a cycle.
+        # The ordered path list exists purely for the log line; the set
+        # companions keep every membership test O(1).
+        if self._pending_edges:
+            targets = set(parent_nodes)
+            visited = {node_id}
+            path = [node_id]
+            path_set = {node_id}
+            stack = [iter(self._pending_edges.get(node_id, ()))]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    path_set.discard(path.pop())
+                    continue
+                if child in targets:
+                    logger.warning(
+                        "Cycle via batch edges: %s",
+                        " -> ".join(path + [child, node_id]),
+                    )
+                    return True
+                if child not in visited:
+                    visited.add(child)
+                    path.append(child)
+                    path_set.add(child)
+                    stack.append(iter(self._pending_edges.get(child, ())))
+
         return False
     
     def _build_node_tree(self, node_id: str, visited: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Build a tree structure for visualization.
-        
+
+        The closure table already names every node in the subtree, so the
+        whole tree is fetched in three bulk queries (descendants, node
+        rows, depth-1 edges) and assembled in memory instead of issuing
+        two queries per node while recursing.
+
         Args:
             node_id: Starting node ID
             visited: Set of visited nodes to prevent cycles
-            
+
         Returns:
             Tree structure as nested dictionary
         """
-        if visited is None:
-            visited = set()
-        
+        descendant_ids = [
+            row[0]
+            for row in self.db.query(HeritageLineage.descendant_node_id).filter(
+                HeritageLineage.ancestor_node_id == node_id
+            ).all()
+        ]
+        subtree_ids = [node_id] + descendant_ids
+
+        nodes = {
+            node.node_id: node
+            for node in self.db.query(ContextualChainNode).filter(
+                ContextualChainNode.node_id.in_(subtree_ids)
+            ).all()
+        }
+
+        children_map: Dict[str, List[str]] = {}
+        edges = self.db.query(
+            HeritageLineage.ancestor_node_id, HeritageLineage.descendant_node_id
+        ).filter(
+            HeritageLineage.ancestor_node_id.in_(subtree_ids),
+            HeritageLineage.depth_distance == 1,
+        ).all()
+        for ancestor_id, descendant_id in edges:
+            children_map.setdefault(ancestor_id, []).append(descendant_id)
+
+        return self._assemble_tree(node_id, nodes, children_map, visited or set())
+
+    def _assemble_tree(
+        self,
+        node_id: str,
+        nodes: Dict[str, ContextualChainNode],
+        children_map: Dict[str, List[str]],
+        visited: Set[str],
+    ) -> Dict[str, Any]:
+        """
+        Assemble the nested tree dict from prefetched nodes and edges.
+
+        Args:
+            node_id: Current node ID
+            nodes: Prefetched node rows keyed by node ID
+            children_map: Direct children keyed by parent node ID
+            visited: Set of visited nodes to prevent cycles
+
+        Returns:
+            Tree structure as nested dictionary
+        """
+        # Explicit-stack walk instead of recursion, so assembly depth is
+        # bounded by memory rather than the interpreter's frame limit if
+        # MAX_CHAIN_DEPTH is ever raised. The shared visited set tracks
+        # only the current path (added on push, discarded when a node's
+        # children are exhausted), keeping cycle detection identical to
+        # the recursive version with O(depth) bookkeeping.
+        def make_entry(nid: str) -> tuple[Dict[str, Any], bool]:
+            node = nodes.get(nid)
+            if node is None:
+                return {"node_id": nid, "error": "not_found"}, False
+            return {
+                "node_id": nid,
+                "node_type": node.node_type,
+                "depth": node.lathering_depth,
+                "children": [],
+                "metadata": node.node_metadata,
+            }, True
+
         if node_id in visited:
             return {"node_id": node_id, "cycle_detected": True}
-        
+
+        root_entry, expand = make_entry(node_id)
+        if not expand:
+            return root_entry
+
         visited.add(node_id)
-        
-        node = self.db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
-        
-        if not node:
-            return {"node_id": node_id, "error": "not_found"}
-        
-        # Find direct children
-        children_lineage = self.db.query(HeritageLineage).filter(
-            HeritageLineage.ancestor_node_id == node_id,
-            HeritageLineage.depth_distance == 1
-        ).all()
-        
-        children = []
-        for child_lineage in children_lineage:
-            child_tree = self._build_node_tree(child_lineage.descendant_node_id, visited.copy())
-            children.append(child_tree)
-        
-        return {
-            "node_id": node_id,
-            "node_type": node.node_type,
-            "depth": node.lathering_depth,
-            "children": children,
-            "metadata": node.node_metadata,
-        }
+        stack = [(node_id, root_entry, iter(children_map.get(node_id, ())))]
+        while stack:
+            current_id, entry, child_iter = stack[-1]
+            child_id = next(child_iter, None)
+            if child_id is None:
+                stack.pop()
+                visited.discard(current_id)
+                continue
+            if child_id in visited:
+                entry["children"].append(
+                    {"node_id": child_id, "cycle_detected": True}
+                )
+                continue
+            child_entry, expand = make_entry(child_id)
+            entry["children"].append(child_entry)
+            if expand:
+                visited.add(child_id)
+                stack.append(
+                    (child_id, child_entry, iter(children_map.get(child_id, ())))
+                )
+
+        return root_entry
 
 
 class ContextualLatheringService:
@@ -438,11 +738,9 @@ class ContextualLatheringService:
             metadata=metadata or {}
         )
         
-        engine.register_node(node_data)
-        
-        return db.query(ContextualChainNode).filter(
-            ContextualChainNode.node_id == node_id
-        ).first()
+        # register_node hands back the flushed model, so no re-fetch is
+        # needed to return it.
+        return engine.register_node(node_data)
     
     @staticmethod
     def get_node_analysis(db: Session, node_id: str) -> Dict[str, Any]:
@@ -1,12 +1,33 @@
 """Cost code service for business logic."""
 
-from typing import Optional, List
+from typing import Callable, Dict, Iterable, Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 
 from app.models.cost_code import CostCode
 from app.schemas.cost_code import CostCodeCreate, CostCodeUpdate
 
+# Callbacks fired after any cost-code mutation. Lets dependent caches
+# (e.g. bid calculation results) invalidate themselves without this
+# module importing them back, which would be circular.
+_mutation_listeners: List[Callable[[], None]] = []
+
+
+def register_mutation_listener(listener: Callable[[], None]) -> None:
+    """
+    Register a callback invoked after cost-code mutations.
+
+    Args:
+        listener: Zero-argument callable to run after create/update/delete
+    """
+    _mutation_listeners.append(listener)
+
+
+def _notify_mutation() -> None:
+    """Run every registered mutation listener."""
+    for listener in _mutation_listeners:
+        listener()
+
 
 class CostCodeService:
     """Service class for cost code operations."""
@@ -23,7 +44,7 @@ class CostCodeService:
         Returns:
             CostCode or None if not found
         """
-        return db.query(CostCode).filter(CostCode.id == cost_code_id).first()
+        return db.get(CostCode, cost_code_id)
 
     @staticmethod
     def get_cost_code_by_code(db: Session, code: str) -> Optional[CostCode]:
@@ -39,6 +60,52 @@ class CostCodeService:
         """
         return db.query(CostCode).filter(CostCode.code == code.upper()).first()
 
+    @staticmethod
+    def get_cost_codes_by_ids(db: Session, cost_code_ids: Iterable[int]) -> Dict[int, CostCode]:
+        """
+        Get multiple cost codes in a single query.
+
+        Callers that resolve cost codes for many line items (e.g. across
+        a page of bids) should use this instead of per-item lookups so
+        the round trips collapse to one IN query.
+
+        Args:
+            db: Database session
+            cost_code_ids: Cost code IDs to fetch
+
+        Returns:
+            Mapping of cost code ID to CostCode (missing IDs are omitted)
+        """
+        ids = set(cost_code_ids)
+        if not ids:
+            return {}
+
+        rows = db.query(CostCode).filter(CostCode.id.in_(ids)).all()
+        return {cost_code.id: cost_code for cost_code in rows}
+
+    @staticmethod
+    def get_cost_codes_by_codes(db: Session, codes: Iterable[str]) -> Dict[str, CostCode]:
+        """
+        Get multiple cost codes by code string in a single query.
+
+        Bulk companion to get_cost_code_by_code for callers that resolve
+        many codes at once (e.g. bill-of-materials style inputs keyed by
+        code rather than ID).
+
+        Args:
+            db: Database session
+            codes: Cost code strings (case-insensitive)
+
+        Returns:
+            Mapping of uppercased code to CostCode (missing codes are omitted)
+        """
+        normalized = {code.upper() for code in codes}
+        if not normalized:
+            return {}
+
+        rows = db.query(CostCode).filter(CostCode.code.in_(normalized)).all()
+        return {cost_code.code: cost_code for cost_code in rows}
+
     @staticmethod
     def get_cost_codes(
         db: Session,
@@ -47,32 +114,41 @@ class CostCodeService:
         category: Optional[str] = None,
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
+        after_id: Optional[int] = None,
     ) -> tuple[List[CostCode], int]:
         """
         Get a list of cost codes with optional filtering.
-        
+
+        Pagination is offset-based by default; passing after_id switches
+        to keyset pagination (rows with id below the cursor), which
+        avoids the scan-and-discard cost of deep OFFSETs on filtered
+        result sets. The caller's cursor for the next page is the last
+        returned row's id.
+
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is set)
             limit: Maximum number of records to return
             category: Filter by category
             is_active: Filter by active status
             search: Search term for code, name, or description
-            
+            after_id: Keyset cursor — return rows with id below this value
+
         Returns:
-            Tuple of (cost codes list, total count)
+            Tuple of (cost codes list, total count; with after_id the
+            count covers rows remaining past the cursor)
         """
-        query = db.query(CostCode)
+        filters = []
 
         if category:
-            query = query.filter(CostCode.category == category)
+            filters.append(CostCode.category == category)
 
         if is_active is not None:
-            query = query.filter(CostCode.is_active == is_active)
+            filters.append(CostCode.is_active == is_active)
 
         if search:
             search_term = f"%{search}%"
-            query = query.filter(
+            filters.append(
                 or_(
                     CostCode.code.ilike(search_term),
                     CostCode.name.ilike(search_term),
@@ -80,10 +156,30 @@ class CostCodeService:
                 )
             )
 
-        total = query.count()
-        cost_codes = query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            filters.append(CostCode.id < after_id)
 
-        return cost_codes, total
+        # COUNT(*) OVER () returns the page and the filtered total in a
+        # single statement, so the (potentially ilike-heavy) filters are
+        # evaluated once instead of twice.
+        query = (
+            db.query(CostCode, func.count().over().label("total"))
+            .filter(*filters)
+            .order_by(CostCode.id.desc())
+        )
+
+        if after_id is None:
+            query = query.offset(skip)
+
+        rows = query.limit(limit).all()
+
+        if rows:
+            return [row.CostCode for row in rows], rows[0].total
+
+        # Page ran past the end of the result set; fall back to a bare
+        # count so callers still see the true total.
+        total = db.query(func.count(CostCode.id)).filter(*filters).scalar() or 0
+        return [], total
 
     @staticmethod
     def create_cost_code(db: Session, cost_code_data: CostCodeCreate) -> CostCode:
@@ -101,8 +197,33 @@ class CostCodeService:
         db.add(db_cost_code)
         db.commit()
         db.refresh(db_cost_code)
+        _notify_mutation()
         return db_cost_code
 
+    @staticmethod
+    def create_cost_codes_bulk(
+        db: Session, cost_codes_data: List[CostCodeCreate]
+    ) -> List[CostCode]:
+        """
+        Create multiple cost codes in a single transaction.
+
+        Seeding flows that POST one code at a time pay an HTTP round
+        trip plus an INSERT and commit per row; this batches the whole
+        list into one add_all and a single commit.
+
+        Args:
+            db: Database session
+            cost_codes_data: List of cost code data
+
+        Returns:
+            List of created CostCodes
+        """
+        db_cost_codes = [CostCode(**data.model_dump()) for data in cost_codes_data]
+        db.add_all(db_cost_codes)
+        db.commit()
+        _notify_mutation()
+        return db_cost_codes
+
     @staticmethod
     def update_cost_code(
         db: Session, cost_code_id: int, cost_code_data: CostCodeUpdate
@@ -128,6 +249,7 @@ class CostCodeService:
 
         db.commit()
         db.refresh(db_cost_code)
+        _notify_mutation()
         return db_cost_code
 
     @staticmethod
@@ -142,10 +264,15 @@ class CostCodeService:
         Returns:
             True if deleted, False if not found
         """
-        db_cost_code = CostCodeService.get_cost_code(db, cost_code_id)
-        if not db_cost_code:
-            return False
-
-        db_cost_code.is_active = False
+        # Single UPDATE instead of read-then-write, matching the bid
+        # delete path: filtering on id alone keeps the delete idempotent
+        # and the rowcount preserves the found/not-found contract.
+        rows = (
+            db.query(CostCode)
+            .filter(CostCode.id == cost_code_id)
+            .update({"is_active": False}, synchronize_session=False)
+        )
         db.commit()
-        return True
+        if rows:
+            _notify_mutation()
+        return rows > 0
@@ -117,12 +117,15 @@ def create_bid_with_context(
     # First create the bid
     url = f"{BASE_URL}/bids"
     line_items = []
-    
-    # Get cost code details
-    for cc_id in cost_code_ids:
-        cc_response = requests.get(f"{BASE_URL}/cost-codes/{cc_id}")
-        if cc_response.status_code == 200:
-            cc = cc_response.json()
+
+    # Get all cost code details in one batched call instead of one
+    # request per ID
+    cc_response = requests.get(
+        f"{BASE_URL}/cost-codes",
+        params={"ids": ",".join(map(str, cost_code_ids))},
+    )
+    if cc_response.status_code == 200:
+        for cc in cc_response.json()["items"]:
             line_items.append({
                 "cost_code_id": cc["id"],
                 "cost_code": cc["code"],
@@ -0,0 +1,115 @@
+"""Shared pytest fixtures for the test suite."""
+
+from functools import lru_cache
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+
+
+@lru_cache(maxsize=None)
+def _build_app():
+    """Construct the app once per process, however many fixtures ask."""
+    from app.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Session-scoped FastAPI application built via the factory."""
+    return _build_app()
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Session-scoped in-memory engine with tables created once.
+
+    Creating the schema per test dominated suite runtime; doing it once
+    and isolating tests with transaction rollback (see the db fixture)
+    keeps every test independent without repeated create_all calls.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's default transaction handling issues its own COMMITs,
+    # which silently breaks SAVEPOINTs — test writes would escape the
+    # db fixture's outer rollback. Take over BEGIN emission as the
+    # SQLAlchemy SQLite docs prescribe so nested transactions hold.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    """
+    Transactional database session for a single test.
+
+    The session joins an external transaction on a dedicated connection
+    and runs its own commits as savepoints, so everything a test writes
+    is rolled back on teardown regardless of how often the code under
+    test commits.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+# Holder the get_db override reads through, so one long-lived client can
+# serve every test while each test still gets its own transactional
+# session.
+_session_holder = {}
+
+
+@pytest.fixture(scope="session")
+def _shared_client(app_instance, db_engine):
+    """
+    Session-scoped test client.
+
+    Building TestClient per test re-ran app lifespan startup and
+    shutdown every time; one client is constructed for the whole run
+    with a get_db override that resolves the current test's session via
+    the holder.
+    """
+
+    def override_get_db():
+        yield _session_holder["db"]
+
+    app_instance.dependency_overrides[get_db] = override_get_db
+    with TestClient(app_instance) as test_client:
+        yield test_client
+    app_instance.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def client(_shared_client, db):
+    """Bind the shared test client to this test's transactional session."""
+    _session_holder["db"] = db
+    return _shared_client
@@ -0,0 +1,48 @@
+"""Request payload factories for API tests."""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _cached_node_payload(
+    node_id: str, node_type: str, parents: Tuple[str, ...]
+) -> Dict[str, Any]:
+    return {
+        "node_id": node_id,
+        "node_type": node_type,
+        "parent_nodes": list(parents),
+        "metadata": {},
+    }
+
+
+def node_payload(
+    node_id: str,
+    node_type: str,
+    parents: Tuple[str, ...] = (),
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build a node-creation payload for POST /contextual-chains/nodes.
+
+    Payloads without metadata are cached on their arguments and shared
+    across tests, so callers must treat them as read-only; passing
+    metadata returns a fresh dict.
+
+    Args:
+        node_id: Node ID
+        node_type: Node type
+        parents: Parent node IDs
+        metadata: Optional metadata dict (bypasses the cache)
+
+    Returns:
+        JSON-serializable request body
+    """
+    if metadata:
+        return {
+            "node_id": node_id,
+            "node_type": node_type,
+            "parent_nodes": list(parents),
+            "metadata": metadata,
+        }
+    return _cached_node_payload(node_id, node_type, tuple(parents))
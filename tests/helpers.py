@@ -0,0 +1,72 @@
+"""Shared helpers for test scaffolding."""
+
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.contextual_chain import ContextualChainNode, HeritageLineage
+from app.services.contextual_service import ContextualChainNodeData
+
+
+def bulk_register_nodes(db: Session, nodes: List[ContextualChainNodeData]) -> None:
+    """
+    Insert a batch of chain nodes and their heritage rows in one shot.
+
+    Scaffolding counterpart to ContextualLatheringEngine.register_node
+    for tests that only need the rows to exist: depths and closure
+    entries are computed in Python over the batch, then everything is
+    written with two executemany INSERTs and a single commit instead of
+    a round trip per node.
+
+    Args:
+        db: Database session
+        nodes: Node data, with parents listed before their children
+
+    Raises:
+        ValueError: If a parent is not defined earlier in the batch
+    """
+    depths: Dict[str, int] = {}
+    ancestors: Dict[str, Dict[str, int]] = {}
+    node_rows = []
+    heritage_rows = []
+
+    for node in nodes:
+        parents = node.parent_nodes or []
+        unknown = [p for p in parents if p not in depths]
+        if unknown:
+            raise ValueError(f"Parents must precede children in the batch: {unknown}")
+
+        depths[node.node_id] = max((depths[p] for p in parents), default=-1) + 1
+
+        # Union parent ancestries at +1 distance, keeping the shortest
+        # path for shared ancestors (mirrors the engine's closure
+        # semantics on diamond shapes).
+        lineage: Dict[str, int] = {}
+        for parent_id in parents:
+            lineage[parent_id] = 1
+            for ancestor_id, distance in ancestors[parent_id].items():
+                if ancestor_id not in lineage or distance + 1 < lineage[ancestor_id]:
+                    lineage[ancestor_id] = distance + 1
+        ancestors[node.node_id] = lineage
+
+        node_rows.append({
+            "node_id": node.node_id,
+            "node_type": node.node_type,
+            "parent_nodes": parents,
+            "node_metadata": node.metadata,
+            "lathering_depth": depths[node.node_id],
+        })
+        heritage_rows.extend(
+            {
+                "ancestor_node_id": ancestor_id,
+                "descendant_node_id": node.node_id,
+                "depth_distance": distance,
+            }
+            for ancestor_id, distance in lineage.items()
+        )
+
+    db.execute(insert(ContextualChainNode), node_rows)
+    if heritage_rows:
+        db.execute(insert(HeritageLineage), heritage_rows)
+    db.commit()
@@ -1,66 +1,53 @@
-"""Tests for contextual chain service and API."""
+"""Tests for contextual chain service and API.
+
+Uses the shared engine, session, and client fixtures from conftest.py.
+"""
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
 
-from app.main import app
-from app.database import Base, get_db
 from app.services.contextual_service import (
     ContextualLatheringEngine,
     ContextualChainNodeData,
 )
+from tests.factories import node_payload
+from tests.helpers import bulk_register_nodes
 
-# Create test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create tables once at module level
-Base.metadata.create_all(bind=engine)
+@pytest.fixture
+def chain_engine(db):
+    """Engine bound to this test's transactional session."""
+    return ContextualLatheringEngine(db)
 
 
-def override_get_db():
-    """Override database dependency for testing."""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+@pytest.fixture
+def chain_factory(chain_engine):
+    """Return a helper that registers a linear chain through the engine.
 
+    Engine-direct registration skips ASGI routing and JSON codecs, so
+    tests that only need scaffolding pay for the inserts and nothing
+    else; the HTTP surface keeps its own dedicated tests.
+    """
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+    def make_chain(length, prefix="chain"):
+        nodes = []
+        for depth in range(length):
+            node = chain_engine.register_node(ContextualChainNodeData(
+                node_id=f"{prefix}-{depth}",
+                node_type="cost_code" if depth == 0 else "bid",
+                parent_nodes=[nodes[-1].node_id] if nodes else [],
+                metadata={},
+            ))
+            nodes.append(node)
+        return nodes
 
+    return make_chain
+
+
+def test_create_root_node_via_api(client):
+    """Test creating a root node through the HTTP surface."""
+    node_data = node_payload("root-node-1", "cost_code")
 
-@pytest.fixture
-def db():
-    """Create database session for testing."""
-    session = TestingSessionLocal()
-    yield session
-    session.close()
-
-
-def test_create_root_node(client):
-    """Test creating a root node with no parents."""
-    node_data = {
-        "node_id": "root-node-1",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {"description": "Root node"}
-    }
-    
     response = client.post("/api/v1/contextual-chains/nodes", json=node_data)
     assert response.status_code == 201
     data = response.json()
@@ -69,183 +56,87 @@ def test_create_root_node(client):
     assert data["lathering_depth"] == 0
     assert data["parent_nodes"] == []
 
+    # Repeat builds come from the factory's cache.
+    assert node_payload("root-node-1", "cost_code") is node_data
 
-def test_create_child_node(client):
-    """Test creating a child node with parent."""
-    # Create root node first
-    root_data = {
-        "node_id": "root-2",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root_data)
-    
-    # Create child node
-    child_data = {
-        "node_id": "child-2-1",
-        "node_type": "bid",
-        "parent_nodes": ["root-2"],
-        "metadata": {"bid_number": "BID-001"}
-    }
-    
-    response = client.post("/api/v1/contextual-chains/nodes", json=child_data)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["node_id"] == "child-2-1"
-    assert data["lathering_depth"] == 1
-    assert data["parent_nodes"] == ["root-2"]
 
+@pytest.mark.parametrize("depth", [0, 1, 2])
+def test_create_node_at_depth(chain_factory, depth):
+    """Test that nodes land at the expected lathering depth."""
+    nodes = chain_factory(depth + 1, prefix=f"depth{depth}")
 
-def test_create_multi_level_chain(client):
-    """Test creating a multi-level chain."""
-    # Level 0: Root
-    root_data = {
-        "node_id": "root-3",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root_data)
-    
-    # Level 1: Child
-    child_data = {
-        "node_id": "child-3-1",
-        "node_type": "bid",
-        "parent_nodes": ["root-3"],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=child_data)
-    
-    # Level 2: Grandchild
-    grandchild_data = {
-        "node_id": "grandchild-3-1-1",
-        "node_type": "roi_analysis",
-        "parent_nodes": ["child-3-1"],
-        "metadata": {}
-    }
-    
-    response = client.post("/api/v1/contextual-chains/nodes", json=grandchild_data)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["lathering_depth"] == 2
+    leaf = nodes[-1]
+    assert leaf.node_id == f"depth{depth}-{depth}"
+    assert leaf.lathering_depth == depth
+    assert leaf.parent_nodes == ([f"depth{depth}-{depth - 1}"] if depth else [])
 
 
-def test_duplicate_node_id(client):
+def test_duplicate_node_id(chain_engine):
     """Test that duplicate node IDs are rejected."""
-    node_data = {
-        "node_id": "duplicate-node",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    
-    # First creation should succeed
-    response = client.post("/api/v1/contextual-chains/nodes", json=node_data)
-    assert response.status_code == 201
-    
-    # Second creation should fail
-    response = client.post("/api/v1/contextual-chains/nodes", json=node_data)
-    assert response.status_code == 400
-    assert "already exists" in response.json()["detail"]
+    node = ContextualChainNodeData(
+        node_id="duplicate-node",
+        node_type="cost_code",
+        parent_nodes=[],
+        metadata={}
+    )
+
+    chain_engine.register_node(node)
+
+    with pytest.raises(ValueError, match="already exists"):
+        chain_engine.register_node(node)
 
 
-def test_circular_dependency_detection(client):
+def test_circular_dependency_detection(chain_engine, chain_factory):
     """Test that circular dependencies are detected."""
-    # Create chain: A -> B
-    node_a = {
-        "node_id": "node-a",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=node_a)
-    
-    node_b = {
-        "node_id": "node-b",
-        "node_type": "bid",
-        "parent_nodes": ["node-a"],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=node_b)
-    
-    # Try to create A with B as parent (would create cycle)
-    # This should be prevented
-    # Note: In current implementation, we can't modify existing nodes,
-    # but we can test self-reference
-    node_c = {
-        "node_id": "node-c",
-        "node_type": "cost_code",
-        "parent_nodes": ["node-c"],  # Self-reference
-        "metadata": {}
-    }
-    response = client.post("/api/v1/contextual-chains/nodes", json=node_c)
-    assert response.status_code == 400
-    assert "circular" in response.json()["detail"].lower()
+    # Existing chain: A -> B. Nodes cannot be modified after creation,
+    # so the reachable cycle case is a self-reference.
+    chain_factory(2, prefix="cycle")
+
+    self_ref = ContextualChainNodeData(
+        node_id="node-c",
+        node_type="cost_code",
+        parent_nodes=["node-c"],
+        metadata={}
+    )
+    with pytest.raises(ValueError, match="circular"):
+        chain_engine.register_node(self_ref)
 
 
-def test_analyze_chain_node(client):
+def test_analyze_chain_node(client, chain_factory):
     """Test analyzing a node in the chain."""
-    # Create a chain
-    root = {
-        "node_id": "analyze-root",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root)
-    
-    child = {
-        "node_id": "analyze-child",
-        "node_type": "bid",
-        "parent_nodes": ["analyze-root"],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=child)
-    
+    chain_factory(2, prefix="analyze")
+
     # Analyze the child node
-    response = client.get("/api/v1/contextual-chains/nodes/analyze-child/analysis")
+    response = client.get("/api/v1/contextual-chains/nodes/analyze-1/analysis")
     assert response.status_code == 200
     data = response.json()
-    assert data["node_id"] == "analyze-child"
+    assert data["node_id"] == "analyze-1"
     assert data["lathering_depth"] == 1
     assert data["total_ancestors"] == 1
-    assert "analyze-root" in data["heritage_lineage"]
+    assert "analyze-0" in data["heritage_lineage"]
     assert "chain_metrics" in data
 
 
-def test_get_chain_snapshot(client):
+def test_get_chain_snapshot(client, db):
     """Test getting a chain snapshot."""
-    # Create a simple chain
-    root = {
-        "node_id": "snapshot-root",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root)
-    
-    child1 = {
-        "node_id": "snapshot-child-1",
-        "node_type": "bid",
-        "parent_nodes": ["snapshot-root"],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=child1)
-    
-    child2 = {
-        "node_id": "snapshot-child-2",
-        "node_type": "bid",
-        "parent_nodes": ["snapshot-root"],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=child2)
-    
+    # Root plus two children, written as one batch.
+    bulk_register_nodes(db, [
+        ContextualChainNodeData(
+            node_id="snapshot-0", node_type="cost_code", parent_nodes=[], metadata={}
+        ),
+        ContextualChainNodeData(
+            node_id="snapshot-1", node_type="bid", parent_nodes=["snapshot-0"], metadata={}
+        ),
+        ContextualChainNodeData(
+            node_id="snapshot-sibling", node_type="bid", parent_nodes=["snapshot-0"], metadata={}
+        ),
+    ])
+
     # Get snapshot
-    response = client.get("/api/v1/contextual-chains/snapshots/snapshot-root")
+    response = client.get("/api/v1/contextual-chains/snapshots/snapshot-0")
     assert response.status_code == 200
     data = response.json()
-    assert data["root_node"] == "snapshot-root"
+    assert data["root_node"] == "snapshot-0"
     assert data["total_nodes"] == 3  # root + 2 children
     assert "node_tree" in data
     assert "snapshot_id" in data
@@ -297,6 +188,44 @@ def test_contextualize_bid(client):
     assert data["node_id"] == f"bid-{bid_id}"
     assert data["node_type"] == "bid"
 
+    # The dashboard aggregates heritage, snapshot, and value flow for
+    # the contextualized bid through the same injected session bind.
+    dashboard = client.get(f"/api/v1/contextual-chains/bids/{bid_id}/dashboard")
+    assert dashboard.status_code == 200
+    dashboard_data = dashboard.json()
+    assert dashboard_data["bid_id"] == bid_id
+    assert dashboard_data["heritage"]["node_id"] == f"bid-{bid_id}"
+    assert dashboard_data["chain_snapshot"]["root_node"] == f"bid-{bid_id}"
+    assert dashboard_data["value_flow"]["bid_id"] == bid_id
+
+
+def test_find_cycles_detects_scc():
+    """Test that the Tarjan pass reports cycle groups and self-loops."""
+    from app.graph import find_cycles
+
+    graph = {
+        "a": ["b"],
+        "b": ["c"],
+        "c": ["a"],
+        "d": ["a"],
+        "e": ["e"],
+        "f": [],
+    }
+
+    cycles = find_cycles(graph)
+    assert sorted(sorted(group) for group in cycles) == [["a", "b", "c"], ["e"]]
+
+
+def test_chain_cycle_audit(client, chain_factory):
+    """Test the full-graph cycle audit endpoint on an acyclic chain."""
+    chain_factory(2, prefix="audit")
+
+    response = client.get("/api/v1/contextual-chains/cycles")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["cycles"] == []
+    assert data["total"] == 0
+
 
 def test_engine_heritage_lineage(db):
     """Test heritage lineage calculation using the engine directly."""
@@ -364,41 +293,133 @@ def test_engine_chain_metrics(db):
     assert metrics["is_leaf"] is True
 
 
-def test_multiple_parents(client):
+def test_multiple_parents(chain_engine):
     """Test node with multiple parent nodes."""
     # Create two root nodes
-    root1 = {
-        "node_id": "multi-root-1",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root1)
-    
-    root2 = {
-        "node_id": "multi-root-2",
-        "node_type": "cost_code",
-        "parent_nodes": [],
-        "metadata": {}
-    }
-    client.post("/api/v1/contextual-chains/nodes", json=root2)
-    
+    for node_id in ("multi-root-1", "multi-root-2"):
+        chain_engine.register_node(ContextualChainNodeData(
+            node_id=node_id,
+            node_type="cost_code",
+            parent_nodes=[],
+            metadata={}
+        ))
+
     # Create child with both parents
-    child = {
-        "node_id": "multi-child",
-        "node_type": "bid",
-        "parent_nodes": ["multi-root-1", "multi-root-2"],
-        "metadata": {}
-    }
-    
-    response = client.post("/api/v1/contextual-chains/nodes", json=child)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["lathering_depth"] == 1
-    assert len(data["parent_nodes"]) == 2
-    
+    child = chain_engine.register_node(ContextualChainNodeData(
+        node_id="multi-child",
+        node_type="bid",
+        parent_nodes=["multi-root-1", "multi-root-2"],
+        metadata={}
+    ))
+
+    assert child.lathering_depth == 1
+    assert len(child.parent_nodes) == 2
+
     # Check heritage lineage
-    analysis = client.get("/api/v1/contextual-chains/nodes/multi-child/analysis")
-    assert analysis.status_code == 200
-    analysis_data = analysis.json()
-    assert analysis_data["total_ancestors"] == 2
+    lineage = chain_engine.get_heritage_lineage("multi-child")
+    assert len(lineage) == 2
+    assert set(lineage) == {"multi-root-1", "multi-root-2"}
+
+
+def test_register_statement_count_constant_in_depth(db, chain_engine, chain_factory):
+    """Test that registering a node costs the same at any chain depth.
+
+    The cycle check and closure insert are single set-based statements,
+    so a deep parent must not make registration issue more SQL than a
+    shallow one. Statement counts are asserted instead of wall time to
+    keep the test deterministic.
+    """
+    chain_factory(8, prefix="reg")
+
+    def statements_for(node_id, parent_id):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE")):
+                statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            chain_engine.register_node(ContextualChainNodeData(
+                node_id=node_id,
+                node_type="bid",
+                parent_nodes=[parent_id],
+                metadata={},
+            ))
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+        return len(statements)
+
+    shallow = statements_for("reg-shallow", "reg-0")
+    deep = statements_for("reg-deep", "reg-7")
+    assert deep == shallow
+
+
+def test_diamond_dag_lineage_cached(db, chain_engine):
+    """Test shared ancestors dedupe and repeat lineage reads hit the cache."""
+    # Diamond: two mid nodes share one root and feed a single leaf.
+    chain_engine.register_node(ContextualChainNodeData(
+        node_id="dia-root", node_type="cost_code", parent_nodes=[], metadata={}
+    ))
+    for node_id in ("dia-left", "dia-right"):
+        chain_engine.register_node(ContextualChainNodeData(
+            node_id=node_id, node_type="bid", parent_nodes=["dia-root"], metadata={}
+        ))
+    chain_engine.register_node(ContextualChainNodeData(
+        node_id="dia-leaf",
+        node_type="roi_analysis",
+        parent_nodes=["dia-left", "dia-right"],
+        metadata={}
+    ))
+
+    # The shared grandparent appears once, not once per path.
+    lineage = chain_engine.get_heritage_lineage("dia-leaf")
+    assert len(lineage) == 3
+    assert set(lineage) == {"dia-root", "dia-left", "dia-right"}
+
+    # A repeat read must come from the session-scoped cache without
+    # touching the database again.
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        repeat = chain_engine.get_heritage_lineage("dia-leaf")
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert repeat == lineage
+    assert statements == []
+
+
+def test_lineage_cold_read_is_single_statement(db, chain_engine, chain_factory):
+    """Test a cold lineage read costs one statement regardless of depth."""
+    chain_factory(6, prefix="deep")
+
+    # Drop the session cache so the read below actually hits the
+    # database.
+    db.info.pop("lineage_cache", None)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # Ignore transaction bookkeeping (SAVEPOINT et al.) emitted by
+        # the test fixture's nested-transaction setup.
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        lineage = chain_engine.get_heritage_lineage("deep-5")
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert len(lineage) == 5
+    # The closure table answers the whole ancestry in one SELECT; a
+    # per-level walk would scale with chain depth.
+    assert len(statements) == 1